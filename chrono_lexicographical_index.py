@@ -1,5 +1,4 @@
-from typing import List, Tuple, Optional
-import bisect
+from typing import Dict, List, Tuple, Optional
 
 
 def query_prefix_recent_timestamp(operations: List[Tuple[str, str, int]]) -> Optional[int]:
@@ -17,49 +16,58 @@ def query_prefix_recent_timestamp(operations: List[Tuple[str, str, int]]) -> Opt
         >>> query_prefix_recent_timestamp([("add", "apple", 10), ("add", "apply", 20), ("query_prefix", "app", 0)])
         20
     """
-    _time_sorted_list: List[Tuple[int, str]] = []
-    _prefix_trie: dict = {}
+    # Flat prefix index: every prefix of every added word maps straight to the
+    # timestamp of its most recent entry, so neither insert nor query has to
+    # chase a chain of per-character dicts.
+    _prefix_latest: Dict[str, int] = {}
+    _root_latest: Optional[int] = None  # Latest timestamp overall, for empty prefix queries
+
+    # "add" operations are buffered and applied in one batch right before the
+    # next query; adds after the last query are never applied at all.
+    _pending_adds: List[Tuple[str, int]] = []
 
     result = None  # Initialize result to store the output of the query_prefix operation
 
+    # --- Helper functions (inlined within the main function) ---
+    def _flush_adds() -> None:
+        """Applies all buffered (word, timestamp) adds to the index state."""
+        nonlocal _root_latest
+
+        # Bind the hot containers and methods to locals for the per-word loop
+        prefix_latest = _prefix_latest
+        get_latest = prefix_latest.get
+        root_latest = _root_latest
+
+        for word, timestamp in _pending_adds:
+            if root_latest is None or timestamp > root_latest:
+                root_latest = timestamp
+
+            word_len = len(word)
+            for i in range(1, word_len + 1):
+                current_latest = get_latest(word[:i])
+                if current_latest is None or timestamp > current_latest:
+                    # A longer prefix never holds a later timestamp than a shorter one,
+                    # so every remaining prefix is beaten too: store without comparing.
+                    for j in range(i, word_len + 1):
+                        prefix_latest[word[:j]] = timestamp
+                    break
+
+        _root_latest = root_latest
+        _pending_adds.clear()
+
     for op_type, arg1, arg2 in operations:
         if op_type == "add":
-            word = arg1
-            timestamp = arg2
-
-            bisect.insort(_time_sorted_list, (timestamp, word))
-
-            node = _prefix_trie
-            # Update root's latest for empty prefix queries
-            current_latest_ts_root = node.get('_latest', (-1, ''))[0]
-            if timestamp >= current_latest_ts_root:
-                node['_latest'] = (timestamp, word)
-
-            for char in word:
-                if char not in node:
-                    node[char] = {}
-                node = node[char]
-                current_latest_ts = node.get('_latest', (-1, ''))[0]
-                if timestamp >= current_latest_ts:
-                    node['_latest'] = (timestamp, word)
-            node['_end'] = True
+            _pending_adds.append((arg1, arg2))
 
         elif op_type == "query_prefix":
             prefix = arg1
 
-            node = _prefix_trie
-            for char in prefix:
-                if char not in node:
-                    result = None  # Set result to None if prefix not found
-                    break  # Exit the loop early
-                node = node[char]
-            else:  # This else block executes if the for loop completes without a break
-                if '_latest' in node:
-                    result = node['_latest'][0]
-                else:
-                    result = None  # Set result to None if _latest not found at the end of prefix
+            if _pending_adds:
+                _flush_adds()
+            result = _prefix_latest.get(prefix) if prefix else _root_latest
             # Assuming only one "query_prefix" operation at the end for the final result
             # If multiple queries are expected, this would need to return a list of results
+    # Adds after the last query cannot change the result, so they are never flushed.
     return result
 
 
@@ -135,4 +143,35 @@ def test_eight():
         ("add", "cat", 30),
         ("add", "zebra", 40),
         ("query_prefix", "", 0)
-    ]) == 40
\ No newline at end of file
+    ]) == 40
+
+
+def test_nine():
+    # Adds buffered before and after an intermediate query are all applied
+    assert query_prefix_recent_timestamp([
+        ("add", "apple", 10),
+        ("query_prefix", "app", 0),
+        ("add", "apply", 5),
+        ("add", "applet", 15),
+        ("query_prefix", "appl", 0)
+    ]) == 15
+
+
+def test_ten():
+    # An add that loses at a short prefix can still win at a longer one
+    operations = [
+        ("add", "ab", 1),
+        ("add", "ac", 10),
+        ("add", "abx", 5)
+    ]
+    assert query_prefix_recent_timestamp(operations + [("query_prefix", "ab", 0)]) == 5
+    assert query_prefix_recent_timestamp(operations + [("query_prefix", "abx", 0)]) == 5
+    assert query_prefix_recent_timestamp(operations + [("query_prefix", "a", 0)]) == 10
+
+    # An older add must not overwrite the longer prefixes of a newer word
+    operations = [
+        ("add", "abcd", 20),
+        ("add", "abc", 15)
+    ]
+    assert query_prefix_recent_timestamp(operations + [("query_prefix", "abc", 0)]) == 20
+    assert query_prefix_recent_timestamp(operations + [("query_prefix", "abcd", 0)]) == 20
\ No newline at end of file
@@ -1,5 +1,18 @@
-from typing import List, Tuple, Any
-import re
+from __future__ import annotations
+
+from typing import Callable, Dict, List, Tuple, Any
+
+# Operand addressing modes, decoded once per program
+_MODE_VALUE = 0
+_MODE_REGISTER = 1
+_MODE_POINTER = 2
+_OPERAND_MODES = {'V': _MODE_VALUE, 'R': _MODE_REGISTER, 'P': _MODE_POINTER}
+
+_Operand = Tuple[int, int]  # (addressing mode, number)
+_Step = Callable[[int], Tuple[int, int]]  # Compiled instruction: cf -> (next ip, cf)
+
+# Entries into a loop head before its loop body is compiled into a single trace
+_TRACE_THRESHOLD = 50
 
 
 def run_cpu_program(initial_registers: List[int], instructions: List[str], max_steps: int = 500000) -> List[int]:
@@ -8,6 +21,9 @@ def run_cpu_program(initial_registers: List[int], instructions: List[str], max_s
     addressing modes (Value, Register Direct, Register Pointer).
     Executes instructions like MOV, ADD, MUL, CMP, JMP, JEQ, JGT, JLT, HALT.
     All CPU state and logic are contained within this single function.
+    Each instruction is compiled once up front into a closure with its
+    operands and fall-through address already bound, and hot loop bodies
+    are further compiled into single generated functions (traces).
 
     Args:
         initial_registers: A list of initial integer values for the CPU registers.
@@ -20,110 +36,380 @@ def run_cpu_program(initial_registers: List[int], instructions: List[str], max_s
 
     # --- CPU State (formerly class attributes) ---
     registers: List[int] = list(initial_registers)  # Make a copy to avoid modifying original
+    register_count: int = len(registers)  # The register file never changes size
     ip: int = 0  # Instruction Pointer
     cf: int = 0  # Comparison Flag (-1 for <, 0 for ==, 1 for >)
     steps_executed: int = 0
 
-    # Pre-compile regex outside the loop for efficiency
-    operand_regex = re.compile(r'([VRP])(\d+)')
+    # Programs reuse a handful of operand strings, so each is decoded only once
+    operand_cache: Dict[str, _Operand] = {}
 
     # --- Helper functions (inlined within the main function) ---
-    def _get_value(operand_str: str) -> int:
-        """Decodes operand string to its integer value."""
-        match = operand_regex.match(operand_str)
-        if not match:
+    def _decode_operand(operand_str: str) -> _Operand:
+        """Decodes operand string into an (addressing mode, number) pair."""
+        decoded = operand_cache.get(operand_str)
+        if decoded is not None:
+            return decoded
+
+        mode = _OPERAND_MODES.get(operand_str[:1])
+        num_str = operand_str[1:]
+        if mode is None or not num_str.isdecimal():
             # Handle invalid operand format, though input is assumed valid by problem
             raise ValueError(f"Invalid operand format: {operand_str}")
 
-        mode, num_str = match.groups()
         num = int(num_str)
+        # Register numbers are fixed by the program text, so bounds-check them once here
+        if mode == _MODE_REGISTER and num >= register_count:
+            raise IndexError(f"Register R{num} out of bounds.")
+        if mode == _MODE_POINTER and num >= register_count:
+            raise IndexError(f"Register R{num} (for pointer) out of bounds.")
 
-        if mode == 'V': return num
-        if mode == 'R':
-            if num < 0 or num >= len(registers):
-                raise IndexError(f"Register R{num} out of bounds.")
-            return registers[num]
-        if mode == 'P':
-            # Pointer: value at register 'num' is the index
-            if num < 0 or num >= len(registers):
-                raise IndexError(f"Register R{num} (for pointer) out of bounds.")
-            ptr_index = registers[num]
-            if ptr_index < 0 or ptr_index >= len(registers):
-                raise IndexError(f"Pointer address R[{num}] -> R[{ptr_index}] out of bounds.")
-            return registers[ptr_index]
-        return -1  # Should not be reached given valid modes
+        decoded = operand_cache[operand_str] = (mode, num)
+        return decoded
 
-    def _set_value(operand_str: str, value: int) -> None:
-        """Sets a value at the destination specified by an operand string."""
-        match = operand_regex.match(operand_str)
-        if not match:
-            raise ValueError(f"Invalid operand format for set: {operand_str}")
+    def _reader(operand: _Operand) -> Callable[[], int]:
+        """Builds a closure returning the current value of a decoded operand."""
+        mode, num = operand
 
-        mode, num_str = match.groups()
-        num = int(num_str)
+        if mode == _MODE_VALUE:
+            return lambda: num
+        if mode == _MODE_REGISTER:
+            return lambda: registers[num]
 
-        if mode == 'R':
-            if num < 0 or num >= len(registers):
-                raise IndexError(f"Register R{num} out of bounds for write.")
-            registers[num] = value
-        elif mode == 'P':
+        def read_pointer() -> int:
             # Pointer: value at register 'num' is the index
-            if num < 0 or num >= len(registers):
-                raise IndexError(f"Register R{num} (for pointer) out of bounds for write.")
             ptr_index = registers[num]
-            if ptr_index < 0 or ptr_index >= len(registers):
-                raise IndexError(f"Pointer address R[{num}] -> R[{ptr_index}] out of bounds for write.")
-            registers[ptr_index] = value
-        # 'V' mode (Value) cannot be a destination, so no else needed.
+            if ptr_index < 0 or ptr_index >= register_count:
+                raise IndexError(f"Pointer address R[{num}] -> R[{ptr_index}] out of bounds.")
+            return registers[ptr_index]
+        return read_pointer
+
+    def _writer(operand: _Operand) -> Callable[[int], None]:
+        """Builds a closure storing a value at the destination of a decoded operand."""
+        mode, num = operand
+
+        if mode == _MODE_REGISTER:
+            def write_register(value: int) -> None:
+                registers[num] = value
+            return write_register
+        if mode == _MODE_POINTER:
+            def write_pointer(value: int) -> None:
+                # Pointer: value at register 'num' is the index
+                ptr_index = registers[num]
+                if ptr_index < 0 or ptr_index >= register_count:
+                    raise IndexError(f"Pointer address R[{num}] -> R[{ptr_index}] out of bounds for write.")
+                registers[ptr_index] = value
+            return write_pointer
+        # 'V' mode (Value) cannot be a destination, so the write is dropped.
+        return lambda value: None
+
+    def _literal_target(address: int, target_ip: int) -> int:
+        """Resolves the literal target of the jump at 'address' to the IP it continues at.
+
+        A (taken) jump to its own address changes no state, cf included, so it would
+        only repeat until max_steps: it resolves to -1 and stops execution instead.
+        """
+        return -1 if target_ip == address else target_ip
+
+    # --- Instruction compilers: each binds one decoded instruction (its operands and the
+    # address of the following instruction) into a step(cf) -> (next ip, cf) closure.
+    # Register/literal operands get steps with the register access inlined; any
+    # other combination goes through operand reader/writer closures. ---
+    def _compile_mov(next_ip: int, operands: Tuple[_Operand, ...]) -> _Step:
+        dst, src = operands[0], operands[1]
+
+        if dst[0] == _MODE_REGISTER and src[0] != _MODE_POINTER:
+            d, n = dst[1], src[1]
+            if src[0] == _MODE_VALUE:
+                def step(cf: int) -> Tuple[int, int]:
+                    registers[d] = n
+                    return next_ip, cf
+            else:
+                def step(cf: int) -> Tuple[int, int]:
+                    registers[d] = registers[n]
+                    return next_ip, cf
+            return step
+
+        write_dst, read_src = _writer(dst), _reader(src)
+
+        def step(cf: int) -> Tuple[int, int]:
+            write_dst(read_src())
+            return next_ip, cf
+        return step
+
+    def _compile_add(next_ip: int, operands: Tuple[_Operand, ...]) -> _Step:
+        dst, src = operands[0], operands[1]
+
+        if dst[0] == _MODE_REGISTER and src[0] != _MODE_POINTER:
+            d, n = dst[1], src[1]
+            if src[0] == _MODE_VALUE:
+                def step(cf: int) -> Tuple[int, int]:
+                    registers[d] += n
+                    return next_ip, cf
+            else:
+                def step(cf: int) -> Tuple[int, int]:
+                    registers[d] += registers[n]
+                    return next_ip, cf
+            return step
+
+        write_dst, read_dst, read_src = _writer(dst), _reader(dst), _reader(src)
+
+        def step(cf: int) -> Tuple[int, int]:
+            write_dst(read_dst() + read_src())
+            return next_ip, cf
+        return step
+
+    def _compile_mul(next_ip: int, operands: Tuple[_Operand, ...]) -> _Step:
+        dst, src = operands[0], operands[1]
+
+        if dst[0] == _MODE_REGISTER and src[0] != _MODE_POINTER:
+            d, n = dst[1], src[1]
+            if src[0] == _MODE_VALUE:
+                def step(cf: int) -> Tuple[int, int]:
+                    registers[d] *= n
+                    return next_ip, cf
+            else:
+                def step(cf: int) -> Tuple[int, int]:
+                    registers[d] *= registers[n]
+                    return next_ip, cf
+            return step
+
+        write_dst, read_dst, read_src = _writer(dst), _reader(dst), _reader(src)
+
+        def step(cf: int) -> Tuple[int, int]:
+            write_dst(read_dst() * read_src())
+            return next_ip, cf
+        return step
+
+    def _compile_cmp(next_ip: int, operands: Tuple[_Operand, ...]) -> _Step:
+        lhs, rhs = operands[0], operands[1]
+
+        if lhs[0] == _MODE_REGISTER and rhs[0] != _MODE_POINTER:
+            a, n = lhs[1], rhs[1]
+            if rhs[0] == _MODE_VALUE:
+                def step(cf: int) -> Tuple[int, int]:
+                    val1 = registers[a]
+                    return next_ip, (val1 > n) - (val1 < n)
+            else:
+                def step(cf: int) -> Tuple[int, int]:
+                    val1, val2 = registers[a], registers[n]
+                    return next_ip, (val1 > val2) - (val1 < val2)
+            return step
+
+        read_lhs, read_rhs = _reader(lhs), _reader(rhs)
+
+        def step(cf: int) -> Tuple[int, int]:
+            val1, val2 = read_lhs(), read_rhs()
+            return next_ip, (val1 > val2) - (val1 < val2)
+        return step
+
+    def _compile_jmp(next_ip: int, operands: Tuple[_Operand, ...]) -> _Step:
+        target = operands[0]
+
+        if target[0] == _MODE_VALUE:
+            # Literal target: resolve the destination address now
+            target_ip = _literal_target(next_ip - 1, target[1])
+
+            def step(cf: int) -> Tuple[int, int]:
+                return target_ip, cf
+            return step
+
+        read_target = _reader(target)
+
+        def step(cf: int) -> Tuple[int, int]:
+            return read_target(), cf
+        return step
+
+    def _conditional_jump(flag: int) -> Callable[[int, Tuple[_Operand, ...]], _Step]:
+        """Builds the compiler for a jump taken only when the comparison flag equals 'flag'."""
+        def compile_jump(next_ip: int, operands: Tuple[_Operand, ...]) -> _Step:
+            target = operands[0]
+
+            if target[0] == _MODE_VALUE:
+                # Literal target: resolve the destination address now
+                target_ip = _literal_target(next_ip - 1, target[1])
+
+                def step(cf: int) -> Tuple[int, int]:
+                    return (target_ip if cf == flag else next_ip), cf
+                return step
+
+            read_target = _reader(target)
+
+            def step(cf: int) -> Tuple[int, int]:
+                if cf == flag:
+                    return read_target(), cf
+                return next_ip, cf
+            return step
+        return compile_jump
+
+    def _compile_halt(next_ip: int, operands: Tuple[_Operand, ...]) -> _Step:
+        def step(cf: int) -> Tuple[int, int]:
+            return -1, cf  # Any IP outside the program stops execution
+        return step
+
+    def _compile_nop(next_ip: int, operands: Tuple[_Operand, ...]) -> _Step:
+        def step(cf: int) -> Tuple[int, int]:
+            return next_ip, cf  # Blank lines and unknown opcodes just advance
+        return step
+
+    def _compile_missing_operands(instruction: str) -> _Step:
+        # Too few operands only fails if the instruction is actually executed
+        def step(cf: int) -> Tuple[int, int]:
+            raise IndexError(f"Missing operand in instruction: {instruction}")
+        return step
+
+    # Opcode -> (compiler, number of operands it reads)
+    dispatch = {
+        "MOV": (_compile_mov, 2), "ADD": (_compile_add, 2), "MUL": (_compile_mul, 2),
+        "CMP": (_compile_cmp, 2), "JMP": (_compile_jmp, 1), "JEQ": (_conditional_jump(0), 1),
+        "JGT": (_conditional_jump(1), 1), "JLT": (_conditional_jump(-1), 1),
+        "HALT": (_compile_halt, 0),
+    }
+
+    # --- Compile the program once, so the execution loop does no decoding or dispatch ---
+    program: List[_Step] = []
+    decoded: List[Tuple[str, Tuple[_Operand, ...]]] = []  # (opcode, operands); "" for no-ops
+    for address, instruction in enumerate(instructions):
+        parts = instruction.replace(',', ' ').split()
+        opcode = parts[0] if parts and parts[0] in dispatch else ""
+        compiler, arity = dispatch[opcode] if opcode else (_compile_nop, 0)
+        operands = tuple(_decode_operand(operand) for operand in parts[1:1 + arity])
+        if len(operands) < arity:
+            program.append(_compile_missing_operands(instruction))
+        else:
+            program.append(compiler(address + 1, operands))
+        decoded.append((opcode, operands))
+
+    # --- Trace compilation for hot loops ---
+    # Targets of backward literal jumps are loop heads. Once a loop head has been
+    # entered _TRACE_THRESHOLD times, the straight-line run of instructions starting
+    # there (through any conditional jumps, up to the next unconditional transfer) is
+    # generated as one Python function, so each pass over the loop body is one call.
+    loop_heads = {
+        operands[0][1]
+        for address, (opcode, operands) in enumerate(decoded)
+        if opcode.startswith("J") and operands and operands[0][0] == _MODE_VALUE and operands[0][1] < address
+    }
+    if loop_heads:  # Programs without a loop skip the trace machinery entirely
+        def _operand_source(operand: _Operand, helpers: Dict[str, Callable]) -> str:
+            """Python expression reading a decoded operand inside generated trace code.
+
+            Pointer operands are read through a _reader closure registered in 'helpers'.
+            """
+            mode, num = operand
+            if mode == _MODE_VALUE:
+                return repr(num)
+            if mode == _MODE_REGISTER:
+                return f"registers[{num}]"
+            name = f"read_p{num}"
+            helpers[name] = _reader(operand)
+            return f"{name}()"
+
+        def _store_source(operand: _Operand, value_source: str, helpers: Dict[str, Callable]) -> str:
+            """Python statement writing to a decoded operand inside generated trace code.
+
+            Non-register destinations are written through a _writer closure registered in 'helpers'.
+            """
+            mode, num = operand
+            if mode == _MODE_REGISTER:
+                return f"registers[{num}] = {value_source}"
+            name = f"write_{'p' if mode == _MODE_POINTER else 'v'}{num}"
+            helpers[name] = _writer(operand)
+            return f"{name}({value_source})"
+
+        def _target_source(address: int, operand: _Operand, helpers: Dict[str, Callable]) -> str:
+            """Python expression for the IP the jump at 'address' continues at inside trace code."""
+            if operand[0] == _MODE_VALUE:
+                return repr(_literal_target(address, operand[1]))
+            return _operand_source(operand, helpers)
+
+        def _compile_trace(start: int) -> Tuple[Callable[[int], Tuple[int, int, int]], int]:
+            """Generates the trace starting at 'start'.
+
+            Returns the trace function, cf -> (next ip, cf, steps executed), and the
+            number of instructions it covers (the most steps one call can take).
+            """
+            lines = []
+            helpers: Dict[str, Callable] = {}
+            address = start
+            while True:
+                opcode, operands = decoded[address]
+                used = address - start + 1  # Steps executed once this instruction has run
+                if opcode and len(operands) < dispatch[opcode][1]:
+                    # Leave the trace before a malformed instruction so its own step raises
+                    lines.append(f"return {address}, cf, {used - 1}")
+                    break
+                if opcode in ("MOV", "ADD", "MUL"):
+                    dst, src = operands[0], operands[1]
+                    value = _operand_source(src, helpers)
+                    if opcode != "MOV":
+                        value = f"{_operand_source(dst, helpers)} {'+' if opcode == 'ADD' else '*'} {value}"
+                    lines.append(_store_source(dst, value, helpers))
+                elif opcode == "CMP":
+                    lines.append(f"val1 = {_operand_source(operands[0], helpers)}")
+                    lines.append(f"val2 = {_operand_source(operands[1], helpers)}")
+                    lines.append("cf = (val1 > val2) - (val1 < val2)")
+                elif opcode in ("JEQ", "JGT", "JLT"):
+                    flag = {"JEQ": 0, "JGT": 1, "JLT": -1}[opcode]
+                    lines.append(f"if cf == {flag}: return {_target_source(address, operands[0], helpers)}, cf, {used}")
+                elif opcode == "JMP":
+                    lines.append(f"return {_target_source(address, operands[0], helpers)}, cf, {used}")
+                    break
+                elif opcode == "HALT":
+                    lines.append(f"return -1, cf, {used}")
+                    break
+
+                address += 1
+                if address == len(decoded):
+                    lines.append(f"return {address}, cf, {used}")
+                    break
+
+            # Helpers are bound as default arguments so the trace reads them as fast locals
+            namespace = dict(helpers, registers=registers)
+            parameters = "".join(f", {name}={name}" for name in namespace)
+            source = f"def trace(cf{parameters}):\n" + "".join(f"    {line}\n" for line in lines)
+            exec(source, namespace)
+            return namespace["trace"], address - start + 1
+
+        def _install_trace(start: int) -> None:
+            """Replaces the step at 'start' with one that runs the compiled trace."""
+            trace, length = _compile_trace(start)
+            if length == 1:
+                return  # A lone jump gains nothing from a trace
+            step = program[start]
+
+            def trace_step(cf: int) -> Tuple[int, int]:
+                nonlocal steps_executed
+                # The main loop has already counted this first step
+                if steps_executed + length - 1 > max_steps:
+                    return step(cf)  # Not enough step budget left for a full trace
+                next_ip, cf, used = trace(cf)
+                steps_executed += used - 1
+                return next_ip, cf
+            program[start] = trace_step
+
+        def _watch_loop_head(start: int) -> None:
+            """Wraps the step at 'start' so it compiles its trace once it becomes hot."""
+            step = program[start]
+            entries = 0
+
+            def counting_step(cf: int) -> Tuple[int, int]:
+                nonlocal entries
+                entries += 1
+                if entries == _TRACE_THRESHOLD:
+                    program[start] = step
+                    _install_trace(start)
+                return step(cf)
+            program[start] = counting_step
+
+        for start in loop_heads:
+            _watch_loop_head(start)
 
     # --- Main CPU Execution Loop (from run method) ---
-    while 0 <= ip < len(instructions) and steps_executed < max_steps:
+    program_size = len(program)
+    while 0 <= ip < program_size and steps_executed < max_steps:
         steps_executed += 1
-
-        instruction = instructions[ip].strip()
-        if not instruction:
-            ip += 1
-            continue
-
-        parts = instruction.replace(',', ' ').split()
-        opcode = parts[0]
-        operands = parts[1:]
-        jumped = False  # Flag to indicate if IP was modified by a jump
-
-        if opcode == "MOV":
-            _set_value(operands[0], _get_value(operands[1]))
-        elif opcode == "ADD":
-            _set_value(operands[0], _get_value(operands[0]) + _get_value(operands[1]))
-        elif opcode == "MUL":
-            _set_value(operands[0], _get_value(operands[0]) * _get_value(operands[1]))
-        elif opcode == "CMP":
-            val1, val2 = _get_value(operands[0]), _get_value(operands[1])
-            if val1 < val2:
-                cf = -1
-            elif val1 > val2:
-                cf = 1
-            else:
-                cf = 0
-        elif opcode == "JMP":
-            ip = _get_value(operands[0])
-            jumped = True
-        elif opcode == "JEQ":
-            if cf == 0:
-                ip = _get_value(operands[0])
-                jumped = True
-        elif opcode == "JGT":
-            if cf == 1:
-                ip = _get_value(operands[0])
-                jumped = True
-        elif opcode == "JLT":
-            if cf == -1:
-                ip = _get_value(operands[0])
-                jumped = True
-        elif opcode == "HALT":
-            break  # Exit the loop immediately
-
-        if not jumped:
-            ip += 1  # Move to the next instruction if no jump occurred
+        ip, cf = program[ip](cf)
 
     return registers  # Return the final state of the registers
 
@@ -195,4 +481,97 @@ def test_eight():
         "MOV R1, V3", "MOV R0, R1", "JMP R0",
         "ADD R1, V100", "HALT", "ADD R1, V999"
     ]
-    assert run_cpu_program(registers, instructions) == [3, 103]
\ No newline at end of file
+    assert run_cpu_program(registers, instructions) == [3, 103]
+
+
+def test_nine():
+    # Out-of-range register operands are rejected when the program is loaded
+    try:
+        run_cpu_program([0], ["HALT", "MOV R5, V1"])
+    except IndexError:
+        pass
+    else:
+        assert False, "expected IndexError for R5"
+
+
+def test_ten():
+    # Hot loop long enough to be compiled into a trace, cut off by max_steps mid-pass
+    registers = [0, 0]
+    instructions = ["ADD R0, V1", "ADD R1, V2", "JMP V0"]
+    assert run_cpu_program(registers, instructions, max_steps=1000) == [334, 666]
+
+
+def test_eleven():
+    # Conditional jump to itself: spins (state frozen) only when the branch is taken
+    instructions = ["CMP R0, V0", "JEQ V1", "ADD R0, V5"]
+    assert run_cpu_program([0], instructions) == [0]
+    assert run_cpu_program([1], instructions) == [6]
+
+
+def test_twelve():
+    # Hot loop over pointer operands, left through a conditional jump inside the trace
+    # (R0 walks R3..R82 via P0, R2 tracks the max, and every visited value is doubled)
+    values = [(i * 37) % 101 for i in range(80)]
+    registers = [3, 83, 0] + values
+    instructions = [
+        "CMP R0, R1", "JEQ V8", "CMP P0, R2", "JLT V5",
+        "MOV R2, P0", "MUL P0, V2", "ADD R0, V1", "JMP V0",
+        "HALT"
+    ]
+    final_regs = run_cpu_program(registers, instructions)
+    assert final_regs == [83, 83, 100] + [2 * value for value in values]
+
+
+def test_thirteen():
+    # Traces ending at HALT and at the end of the program
+    assert run_cpu_program([0], ["ADD R0, V1", "CMP R0, V100", "JLT V0", "HALT"]) == [100]
+    assert run_cpu_program([0], ["ADD R0, V1", "CMP R0, V100", "JLT V0"]) == [100]
+
+
+def test_fourteen():
+    # A pointer that runs off the register file inside a trace still raises IndexError
+    try:
+        run_cpu_program([1] + [0] * 59, ["ADD P0, V1", "ADD R0, V1", "JMP V0"])
+    except IndexError:
+        pass
+    else:
+        assert False, "expected IndexError for P0"
+
+
+def test_fifteen():
+    # MUL with a register destination and a literal or register source
+    assert run_cpu_program([2, 5], ["MUL R0, V3", "MUL R0, R1", "HALT"]) == [30, 5]
+
+
+def test_sixteen():
+    # Conditional jump through a register target, both taken and not taken
+    instructions = ["MOV R1, V4", "CMP R0, V0", "JEQ R1", "HALT", "ADD R0, V7"]
+    assert run_cpu_program([0, 0], instructions) == [7, 4]
+    assert run_cpu_program([1, 0], instructions) == [1, 4]
+
+
+def test_seventeen():
+    # An instruction missing an operand only fails if it is executed
+    assert run_cpu_program([0], ["HALT", "MOV R0"]) == [0]
+    assert run_cpu_program([0], ["HALT", "JMP"]) == [0]
+    try:
+        run_cpu_program([0], ["MOV R0"])
+    except IndexError:
+        pass
+    else:
+        assert False, "expected IndexError for the missing operand"
+
+    # A hot loop leading into one runs as a trace until it reaches it
+    try:
+        run_cpu_program([0], ["ADD R0, V1", "CMP R0, V60", "JLT V0", "ADD R0"])
+    except IndexError:
+        pass
+    else:
+        assert False, "expected IndexError for the missing operand"
+
+
+def test_eighteen():
+    # Trace starting at a conditional jump to itself stops once that jump is taken
+    # (the registers are the same either way; spinning out a billion steps is not)
+    instructions = ["ADD R0, V1", "CMP R0, V60", "JEQ V2", "JMP V0", "JMP V2"]
+    assert run_cpu_program([0], instructions, max_steps=10 ** 9) == [60]
\ No newline at end of file
@@ -1,5 +1,5 @@
-from typing import List, Tuple, Any
-import bisect
+from typing import Dict, List, Optional, Tuple, Any
+import heapq
 
 
 def process_loyalty_operations(n: int, initial_friendships: List[Tuple[int, int]],
@@ -25,68 +25,145 @@ def process_loyalty_operations(n: int, initial_friendships: List[Tuple[int, int]
 
     # --- Internal state (formerly class attributes) ---
     _parent: List[int] = list(range(n))
+    _rank: List[int] = [0] * n  # Upper bound on tree height, meaningful at roots only
     _loyalties: List[int] = list(initial_loyalties)
-    _scores_in_component: dict = {i: [initial_loyalties[i]] for i in range(n)}
+    # Per-component max-heap of loyalty scores (stored negated). An update leaves the
+    # old score in the heap and counts it in _stale_scores; stale entries are
+    # discarded lazily once they surface at the top. Both are indexed by root and
+    # cleared to None once a root is absorbed by a union.
+    _heaps: List[Optional[List[int]]] = [None] * n  # Built once the initial friendships are settled
+    _stale_scores: List[Optional[Dict[int, int]]] = [None] * n  # root -> {score: stale copies in its heap}
     query_results: List[int] = []
 
     # --- Helper functions (inlined within the main function) ---
     def _find(i: int) -> int:
         """Finds the representative of person 'i's group (path compression)."""
-        if _parent[i] == i:
-            return i
-        _parent[i] = _find(_parent[i])  # Path compression
-        return _parent[i]
+        parent = _parent[i]
+        if _parent[parent] == parent:
+            return parent  # 'i' is a root or hangs directly off one: nothing to compress
 
-    def _union(i: int, j: int) -> None:
-        """Merges groups of person 'i' and person 'j' (union by size/rank not strictly implemented but implied by len check)."""
+        root = parent
+        while _parent[root] != root:
+            root = _parent[root]
+        # Second pass: point every node on the walked path straight at the root
+        while _parent[i] != root:
+            next_i = _parent[i]
+            _parent[i] = root
+            i = next_i
+        return root
+
+    def _link(i: int, j: int) -> Tuple[int, int]:
+        """Joins the DSU trees of person 'i' and person 'j' (union by rank).
+
+        Returns (surviving root, absorbed root); both are the same root if the
+        two people were already in one group.
+        """
         root_i = _find(i)
         root_j = _find(j)
 
         if root_i != root_j:
-            # Union by size heuristic: attach smaller tree to root of larger tree
-            if len(_scores_in_component[root_i]) < len(_scores_in_component[root_j]):
+            # Union by rank: attach the shallower tree under the root of the deeper one
+            if _rank[root_i] < _rank[root_j]:
                 root_i, root_j = root_j, root_i
 
             _parent[root_j] = root_i
-            # Merge sorted lists: extend and re-sort for simplicity,
-            # for performance, could use a merge-like approach if keeping sorted
-            _scores_in_component[root_i].extend(_scores_in_component[root_j])
-            _scores_in_component[root_i].sort()  # Maintain sorted property
-            del _scores_in_component[root_j]
+            if _rank[root_i] == _rank[root_j]:
+                _rank[root_i] += 1
+        return root_i, root_j
+
+    def _union(i: int, j: int) -> None:
+        """Merges groups of person 'i' and person 'j', including their score heaps."""
+        root_i, root_j = _link(i, j)
+
+        if root_i != root_j:
+            # Push the smaller heap's entries into the larger one and carry over its stale counts
+            heap_i, heap_j = _heaps[root_i], _heaps[root_j]
+            if len(heap_i) < len(heap_j):
+                heap_i, heap_j = heap_j, heap_i
+            for neg_score in heap_j:
+                heapq.heappush(heap_i, neg_score)
+            _heaps[root_i] = heap_i
+            _heaps[root_j] = None
+            stale_j = _stale_scores[root_j]
+            _stale_scores[root_j] = None
+            if stale_j:
+                stale_i = _stale_scores[root_i]
+                if stale_i is None:
+                    stale_i = _stale_scores[root_i] = {}
+                for score, count in stale_j.items():
+                    stale_i[score] = stale_i.get(score, 0) + count
+
+    def _max_score(root: int) -> int:
+        """Returns the highest current loyalty in a component, dropping stale heap tops."""
+        heap = _heaps[root]
+        stale = _stale_scores[root]
+        while stale:
+            top = -heap[0]
+            count = stale.get(top)
+            if not count:
+                break
+            heapq.heappop(heap)
+            if count == 1:
+                del stale[top]
+            else:
+                stale[top] = count - 1
+        return -heap[0]
 
     # --- Initial setup (from _init_) ---
+    # Settle the final friendship groups on the DSU alone, then gather each
+    # group's scores and heapify them once, instead of merging heaps per union.
     for p1, p2 in initial_friendships:
-        _union(p1, p2)
+        _link(p1, p2)
+    for person in range(n):
+        root = _find(person)
+        if _heaps[root] is None:
+            _heaps[root] = [-_loyalties[person]]
+        else:
+            _heaps[root].append(-_loyalties[person])
+    for heap in _heaps:
+        if heap is not None:
+            heapq.heapify(heap)
 
     # --- Process operations ---
+    # Root found for the most recently looked-up person, so back-to-back operations on
+    # the same person skip _find. Any union may change roots, so it resets the cache.
+    last_person, last_root = -1, -1
+
     for op_type, arg1, arg2 in operations:
         if op_type == "union":
             _union(arg1, arg2)
+            last_person = -1
         elif op_type == "update":
             person = arg1
             new_loyalty = arg2
 
-            component_root = _find(person)
             old_loyalty = _loyalties[person]
+            if new_loyalty == old_loyalty:
+                continue  # Unchanged score: nothing to mark stale or push
+
+            if person != last_person:
+                last_person, last_root = person, _find(person)
+            component_root = last_root
             _loyalties[person] = new_loyalty
 
-            component_scores = _scores_in_component[component_root]
-            # Remove old loyalty: find and remove the first occurrence
-            # Note: if there are duplicate loyalty scores, this might remove the wrong one
-            # if not careful. For this problem's constraints, assuming direct removal is fine.
-            try:
-                component_scores.remove(old_loyalty)
-            except ValueError:
-                # This could happen if old_loyalty was already updated or somehow missing.
-                # For robustness, you might want to log this or handle it more gracefully.
-                pass
-            bisect.insort(component_scores, new_loyalty)
+            heap = _heaps[component_root]
+            if heap[0] == -old_loyalty:
+                # Old score is the current max: swap it out in place, no stale bookkeeping
+                heapq.heapreplace(heap, -new_loyalty)
+                continue
+
+            # Old score stays in the heap until it reaches the top; just mark one copy stale
+            stale = _stale_scores[component_root]
+            if stale is None:
+                stale = _stale_scores[component_root] = {}
+            stale[old_loyalty] = stale.get(old_loyalty, 0) + 1
+            heapq.heappush(heap, -new_loyalty)
         elif op_type == "query_max":
             person = arg1
 
-            component_root = _find(person)
-            component_scores = _scores_in_component[component_root]
-            query_results.append(component_scores[-1])  # Max is last element in sorted list
+            if person != last_person:
+                last_person, last_root = person, _find(person)
+            query_results.append(_max_score(last_root))
 
     return query_results
 
@@ -187,4 +264,91 @@ def test_seven():
             ("query_max", 4, None)
         ]
     )
-    assert results == [200, 200]
\ No newline at end of file
+    assert results == [200, 200]
+
+
+def test_eight():
+    # Initial setup
+    # Operations: Update 1 to its current score twice, Update 1 to 5, Query max for 0
+    results = process_loyalty_operations(
+        3, [(0, 1)], [10, 20, 30],
+        [
+            ("update", 1, 20),
+            ("update", 1, 20),
+            ("query_max", 0, None),
+            ("update", 1, 5),
+            ("query_max", 0, None)
+        ]
+    )
+    assert results == [20, 10]
+
+
+def test_nine():
+    # Initial setup: one group with duplicate scores
+    # Operations: Lower two non-max 40s, lower the max, Query max, lower the last 40, Query max
+    results = process_loyalty_operations(
+        4, [(0, 1), (1, 2), (2, 3)], [50, 40, 40, 40],
+        [
+            ("update", 1, 10),
+            ("update", 2, 15),
+            ("update", 0, 5),
+            ("query_max", 0, None),
+            ("update", 3, 1),
+            ("query_max", 2, None)
+        ]
+    )
+    assert results == [40, 15]
+
+
+def test_ten():
+    # Initial setup: two groups, each holding a 70 and a 60; the first also holds a 65
+    # Operations: Lower a 60 and then the 70 in each group, Union, Query max, lower the 65, Query max
+    results = process_loyalty_operations(
+        5, [(0, 1), (0, 4), (2, 3)], [70, 60, 70, 60, 65],
+        [
+            ("update", 1, 1),
+            ("update", 0, 3),
+            ("update", 3, 2),
+            ("update", 2, 4),
+            ("union", 0, 2),
+            ("query_max", 1, None),
+            ("update", 4, 0),
+            ("query_max", 3, None)
+        ]
+    )
+    assert results == [65, 4]
+
+
+def test_eleven():
+    # Initial setup: a pair (0, 1) and two singletons
+    # Operations: Union singleton 2 into the pair (lower-ranked tree passed first), Query each group
+    results = process_loyalty_operations(
+        4, [(0, 1)], [5, 7, 9, 1],
+        [
+            ("union", 2, 0),
+            ("query_max", 2, None),
+            ("query_max", 1, None),
+            ("query_max", 3, None)
+        ]
+    )
+    assert results == [9, 9, 1]
+
+
+def test_twelve():
+    # Initial setup: {0, 1, 2, 3} built as two pairs (rank 2, four scores) and a
+    # star around 4 (rank 1, five scores)
+    # Operations: Lower a non-max in the star, Union (the higher-ranked root holds the
+    # smaller heap; only the absorbed side has stale scores), lower the star's max, Query max
+    results = process_loyalty_operations(
+        9, [(0, 1), (2, 3), (0, 2), (4, 5), (4, 6), (4, 7), (4, 8)],
+        [30, 40, 50, 35, 80, 70, 60, 10, 60],
+        [
+            ("update", 5, 1),
+            ("union", 0, 4),
+            ("update", 4, 2),
+            ("query_max", 3, None),
+            ("update", 6, 0),
+            ("query_max", 7, None)
+        ]
+    )
+    assert results == [60, 60]
\ No newline at end of file